@@ -0,0 +1,109 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from app import app, activities
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create a single async client for the FastAPI app, shared across tests"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+# Initial state of the in-memory activity database, restored before each test
+_PRISTINE_ACTIVITIES = {
+    "Basketball": {
+        "description": "Competitive basketball team and practice sessions",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["alex@mergington.edu"]
+    },
+    "Tennis Club": {
+        "description": "Learn tennis skills and play friendly matches",
+        "schedule": "Saturdays, 9:00 AM - 11:00 AM",
+        "max_participants": 10,
+        "participants": ["lucas@mergington.edu"]
+    },
+    "Debate Team": {
+        "description": "Develop argumentation and public speaking skills",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ["sarah@mergington.edu", "james@mergington.edu"]
+    },
+    "Robotics Club": {
+        "description": "Design and build robots for competitions",
+        "schedule": "Thursdays, 4:00 PM - 6:00 PM",
+        "max_participants": 18,
+        "participants": ["ryan@mergington.edu"]
+    },
+    "Drama Club": {
+        "description": "Stage performances and theatrical productions",
+        "schedule": "Tuesdays and Thursdays, 4:45 PM - 6:00 PM",
+        "max_participants": 25,
+        "participants": ["maya@mergington.edu", "tyler@mergington.edu"]
+    },
+    "Visual Arts": {
+        "description": "Painting, drawing, and sculpture classes",
+        "schedule": "Mondays and Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 20,
+        "participants": ["grace@mergington.edu"]
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    }
+}
+
+
+def _clone_pristine():
+    """Return a fresh copy of the pristine activities
+
+    Only the participants lists are mutated by the API, so those are the only
+    values that need copying.
+    """
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _PRISTINE_ACTIVITIES.items()
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_activities():
+    """Reset activities to initial state before each test"""
+    activities.clear()
+    activities.update(_clone_pristine())
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def pristine_activities_response(client):
+    """Fetch GET /activities once against the initial state and return the parsed body"""
+    activities.clear()
+    activities.update(_clone_pristine())
+    response = await client.get("/activities")
+    assert response.status_code == 200
+    return response.json()